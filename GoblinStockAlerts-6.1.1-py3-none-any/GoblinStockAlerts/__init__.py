@@ -1,6 +1,7 @@
 """
 Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL PUBLIC LICENSE.
 """
+from functools import cache
 from typing import Dict
 
 from .__version__ import __version__
@@ -10,7 +11,14 @@ project_github = "https://github.com/binaryhabitat/GoblinStockAlerts"
 project_discord = "https://discord.gg/UeX7RekyUq"
 project_pypi = "https://pypi.org/project/GoblinStockAlerts"
 
-logo = f"""
+
+@cache
+def logo() -> str:
+    """
+    The GSA banner, only built when it's actually going to be printed.
+    """
+
+    return f"""
  .d8888b.   .d8888b.         d8888
 d88P  Y88b d88P  Y88b       d88888
 888    888 Y88b.           d88P888
@@ -27,7 +35,14 @@ GitHub: {project_github}
 PyPI: {project_pypi}
 """
 
-extreme_warning = """\n 
+
+@cache
+def extreme_warning() -> str:
+    """
+    Warning shown when workers are started as processes.
+    """
+
+    return """\n 
                 ***** 
                 WORKERS USING MULTIPROCESSING USES SERIOUS AMOUNTS OF RAM (APPROX 2GB+).. 
 
@@ -40,7 +55,14 @@ extreme_warning = """\n
                 ***** 
                 """
 
-quota_warning = """\n
+
+@cache
+def quota_warning() -> str:
+    """
+    Warning shown when Blizzard has returned a 429 and GSA is backing off.
+    """
+
+    return """\n
 ***
 Slamming on the API brakes. 
 
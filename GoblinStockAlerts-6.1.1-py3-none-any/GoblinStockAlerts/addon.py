@@ -7,9 +7,9 @@ import logging
 import os
 import re
 import shutil
+from collections.abc import Mapping
 from typing import Dict
 
-from mergedeep import merge
 from slpp import slpp as lua
 
 from .__version__ import __version__
@@ -27,6 +27,25 @@ GSAData={
 """
 
 
+def merge_deals(*,
+                destination: Dict,
+                source: Dict
+                ) -> None:
+    """
+    Recursively merge source into destination (in place), where both have a value that isn't a dictionary the source
+    wins. This is what mergedeep's merge did, without the dependency.
+
+    :param destination: The dictionary being merged into.
+    :param source: The dictionary being merged from.
+    """
+
+    for key, value in source.items():
+        if key in destination and isinstance(destination[key], Mapping) and isinstance(value, Mapping):
+            merge_deals(destination=destination[key], source=value)
+        else:
+            destination[key] = value
+
+
 def write_deals_to_addon(*,
                          addon_directory: str,
                          deals: Dict
@@ -50,7 +69,7 @@ def write_deals_to_addon(*,
 
     # Only attempt to smash deals together if lua.decode successfully gave us a dictionary.
     if isinstance(current_data, dict):
-        merge(deals, current_data)
+        merge_deals(destination=deals, source=current_data)
 
     lua_data = lua.encode(deals)
 
@@ -6,10 +6,11 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 
 import logging
 import os
+import sys
 from collections import defaultdict
+from copy import deepcopy
 from typing import Dict
 
-from mergedeep import merge
 from ruamel.yaml import YAML, YAMLError
 
 from .errors import GSAConfigurationError
@@ -45,10 +46,16 @@ def generate_configuration_shopping_data(*,
     if 'global' in configuration:
         logger.info("Global shopping list identified. Adding items to all connected realms.")
 
-        # Generate the shopping list for every possible realm as global was configured.
-        for realm in get_connected_realm_ids(region=configuration['configuration']['region']):
-            shopping_data['realms'][realm] = create_realm_shopping_list(connected_realm="global",
-                                                                        conf=configuration['global'])
+        # The global shopping list is identical for every realm, so only validate and build it once.
+        global_shopping_list = create_realm_shopping_list(connected_realm="global", conf=configuration['global'])
+
+        # Give every possible realm its own copy as global was configured, realm specific lists are merged into them.
+        # An empty global list would only create realms for the clean up below to remove, so don't bother.
+        if global_shopping_list['items'] or global_shopping_list['pets']:
+            for realm in get_connected_realm_ids(region=configuration['configuration']['region']):
+                shopping_data['realms'][realm] = deepcopy(global_shopping_list)
+        else:
+            logger.warning("Global shopping list has no items or pets. Is your config weird?")
 
     for realm in configuration:
 
@@ -62,19 +69,18 @@ def generate_configuration_shopping_data(*,
         # Users could specify any realm on a connected group, so let's get the realm id.
         realm_id = get_realm_connected_id(realm_name=realm_slug, region=configuration['configuration']['region'])
 
-        # Recursively deep merge the realm specific shopping list into the configuration, this means realm specific
+        # Merge the realm specific shopping list into the configuration, this means realm specific
         # pricing trumps the global configuration.
-        merge(shopping_data['realms'][realm_id],
-              create_realm_shopping_list(connected_realm=realm_slug, conf=configuration[realm]))
+        merge_realm_shopping_list(destination=shopping_data['realms'][realm_id],
+                                  source=create_realm_shopping_list(connected_realm=realm_slug,
+                                                                    conf=configuration[realm]))
 
     # Lets do some clean up.
     # If somehow a realm has ended up in the shopping list without items or pets actually in the shopping list.
     # No need to retrieve data that definitely will not have any deals.
-    for realm in list(shopping_data['realms']):
-        items = len(shopping_data['realms'][realm].get('items', {}))
-        pets = len(shopping_data['realms'][realm].get('pets', {}))
-
-        if all((items == 0, pets == 0)):
+    # Every realm shopping list has both 'items' and 'pets', realms only come from global or the merge above.
+    for realm, realm_shopping_list in list(shopping_data['realms'].items()):
+        if not realm_shopping_list['items'] and not realm_shopping_list['pets']:
             del shopping_data['realms'][realm]
             logger.warning(f"Somehow {realm} ended up having a shopping list generated without any items or pets. "
                            f"Is your config weird?")
@@ -116,7 +122,7 @@ def create_realm_shopping_list(*,
             shopping_data['items'][data['id']] = {
                 'id': data['id'],
                 'ilvl': data.get('ilvl', 0),
-                'nickname': f"\033[01;93m*{item}*\033[0m" if data.get('rare', False) else item,
+                'nickname': create_nickname(name=item, rare=data.get('rare', False)),
                 'budget': data['budget'] * 10000
             }
 
@@ -132,7 +138,7 @@ def create_realm_shopping_list(*,
 
             shopping_data['pets'][data['species_id']] = {
                 'species_id': data['species_id'],
-                'nickname': f"\033[01;93m*{pet}*\033[0m" if data.get('rare', False) else pet,
+                'nickname': create_nickname(name=pet, rare=data.get('rare', False)),
                 'budget': data['budget'] * 10000,
             }
 
@@ -152,6 +158,42 @@ def create_realm_shopping_list(*,
     return shopping_data
 
 
+def create_nickname(*,
+                    name: str,
+                    rare: bool
+                    ) -> str:
+    """
+    Create the nickname shown for a shopping item, rare items are highlighted. The same nickname is generated for
+    every realm sharing a shopping list, so it is interned to keep a single copy.
+
+    :param name: The name given to the item/pet in the configuration.
+    :param rare: TRUE if the item/pet was marked as rare.
+    """
+
+    return sys.intern(f"\033[01;93m*{name}*\033[0m" if rare else str(name))
+
+
+def merge_realm_shopping_list(*,
+                              destination: Dict,
+                              source: Dict
+                              ) -> None:
+    """
+    Merge one realm shopping list into another, in place. Shopping lists are always {'items'/'pets': {id: {...}}}, so
+    entries present in both have their settings updated by the source, everything else is added as is.
+
+    :param destination: The shopping list being merged into.
+    :param source: The shopping list whose entries take priority.
+    """
+
+    for category in ('items', 'pets'):
+        if category not in source:
+            continue
+
+        entries = destination.setdefault(category, defaultdict(dict))
+        for entry_id, entry in source[category].items():
+            entries[entry_id].update(entry)
+
+
 def validate_configuration(*,
                            configuration: Dict
                            ) -> None:
@@ -33,53 +33,59 @@ def find_deals(*,
         'pets': defaultdict(list)
     }
 
+    item_auctions = auctions.get('items', {})
+    pet_auctions = auctions.get('pets', {})
+
     # Items
-    for item in realm_config.get('items', []):
+    for item, item_data in realm_config.get('items', {}).items():
 
-        for auction in auctions.get('items', {}).get(item, []):
-            
-            item_data = realm_config['items'][item]
+        # These don't change between auctions of the same item, so only work them out once.
+        budget = item_data['budget']
+        ilvl = item_data.get('ilvl', 0)
+        ilvls = frozenset(ilvl) if isinstance(ilvl, list) else None
 
-            if item_data['budget'] > 0:
-                if auction_price_get(auction=auction) > item_data['budget']:
-                    continue
+        for auction in item_auctions.get(item, []):
 
-            if 'ilvl' in item_data and item_data['ilvl'] != 0:
+            if budget > 0 and auction_price_get(auction=auction) > budget:
+                continue
+
+            if ilvl != 0:
                 auction['gsa_item_level'], auction['gsa_item_suffix'] = iii(auction)
-                if isinstance(item_data['ilvl'], int) and item_data['ilvl'] != auction['gsa_item_level']:
+                if ilvls is None and ilvl != auction['gsa_item_level']:
                     continue
-                if isinstance(item_data['ilvl'], list) and auction['gsa_item_level'] not in item_data['ilvl']:
+                if ilvls is not None and auction['gsa_item_level'] not in ilvls:
                     continue
 
             # We don't want to waste time generating curves for items we have already worked out.
             # This is not done earlier as we also don't want to waste time in items that aren't a deal.
-            if not {'gsa_item_level', 'gsa_item_suffix'}.issubset(auction):
+            # Both fields are always set together, so checking the item level alone is enough.
+            if 'gsa_item_level' not in auction:
                 auction['gsa_item_level'], auction['gsa_item_suffix'] = iii(auction)
 
             deals['items'][item].append(auction)
 
     # Pets
-    for pet in realm_config.get('pets', []):
+    for pet, pet_data in realm_config.get('pets', {}).items():
 
-        for auction in auctions.get('pets', {}).get(pet, []):
-            
-            pet_data = realm_config['pets'][pet]
+        # These don't change between auctions of the same pet, so only work them out once.
+        budget = pet_data['budget']
+        qualities = frozenset(pet_data['quality']) if 'quality' in pet_data else None
+        breeds = frozenset(pet_data['breed']) if 'breed' in pet_data else None
+        level = pet_data.get('level')
 
-            if pet_data['budget'] > 0:
-                if auction_price_get(auction=auction) > pet_data['budget']:
-                    continue
+        for auction in pet_auctions.get(pet, []):
 
-            if 'quality' in pet_data:
-                if auction['item']['pet_quality_id'] not in pet_data['quality']:
-                    continue
+            if budget > 0 and auction_price_get(auction=auction) > budget:
+                continue
 
-            if 'breed' in pet_data:
-                if auction['item']['pet_breed_id'] not in pet_data['breed']:
-                    continue
+            if qualities is not None and auction['item']['pet_quality_id'] not in qualities:
+                continue
 
-            if 'level' in pet_data:
-                if auction['item']['pet_level'] != pet_data['level']:
-                    continue
+            if breeds is not None and auction['item']['pet_breed_id'] not in breeds:
+                continue
+
+            if level is not None and auction['item']['pet_level'] != level:
+                continue
 
             deals['pets'][pet].append(auction)
 
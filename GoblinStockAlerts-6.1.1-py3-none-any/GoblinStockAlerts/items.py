@@ -9,16 +9,28 @@ import os
 from functools import lru_cache
 from typing import Dict, Tuple, Optional
 
-from ruamel.yaml.scalarfloat import ScalarFloat
-from scipy.interpolate import interp1d
+import numpy as np
 
 from . import project_discord
 from .errors import GSAConfigurationError
 from .local_data import load_db, z
-from .pets import PET_CAGE_ID
+from .pets import PET_CAGE_ID, _BUDGET_TYPES
 
 logger = logging.getLogger("GSA")
 
+_ITEM_LEVEL, _ITEM, _LEVEL, _ID, _TYPE, _POINTS, _BONUS_LISTS, _MODIFIERS, _CURVE_ID, _VALUE, _PLAYER_LEVEL, \
+    _CURVE_ITEM_LEVEL, _NAME = z
+
+# Item shopping list keys as (key, required, valid types, error if missing, error if not a valid type).
+_ITEM_SCHEMA = (
+    ('budget', True, _BUDGET_TYPES, "Missing a budget.", "Budget is not valid (int/float)."),
+    ('id', True, int, "Missing an id.", "Item ID is not a valid integer (no decimals)."),
+    ('suffix', False, str, None, "Suffix must be provided in string form, eg. 'of the Aurora'."),
+    ('rare', False, bool, None, "Rare must be provided as a boolean, eg. True or False."),
+    ('ilvl', False, (int, list), None,
+     "An item level was provided, but it was not an integer (whole number) or list."),
+)
+
 
 def check_item_validity(*,
                         item: Dict
@@ -29,30 +41,18 @@ def check_item_validity(*,
     :param item: The item dictionary object.
     """
 
-    if 'budget' not in item:
-        raise GSAConfigurationError(f"Missing a budget.")
-
-    if not isinstance(item['budget'], (int, float, ScalarFloat)):
-        raise GSAConfigurationError(f"Budget is not valid (int/float).")
-
-    if 'id' not in item:
-        raise GSAConfigurationError(f"Missing an id.")
+    for key, required, types, missing_message, invalid_message in _ITEM_SCHEMA:
+        if key not in item:
+            if required:
+                raise GSAConfigurationError(missing_message)
+            continue
 
-    if not isinstance(item['id'], int):
-        raise GSAConfigurationError(f"Item ID is not a valid integer (no decimals).")
+        if not isinstance(item[key], types):
+            raise GSAConfigurationError(invalid_message)
 
     if item['id'] == PET_CAGE_ID:
         raise GSAConfigurationError(f"Pet Cage ({PET_CAGE_ID}) is a forbidden item id. Please use 'pets:' section.")
 
-    if 'suffix' in item and not isinstance(item['suffix'], str):
-        raise GSAConfigurationError("Suffix must be provided in string form, eg. 'of the Aurora'.")
-
-    if 'rare' in item and not isinstance(item['rare'], bool):
-        raise GSAConfigurationError("Rare must be provided as a boolean, eg. True or False.")
-
-    if 'ilvl' in item and not isinstance(item['ilvl'], (int, list)):
-        raise GSAConfigurationError("An item level was provided, but it was not an integer (whole number) or list.")
-
 
 def iii(a) -> Tuple[int, Optional[str]]:
     """
@@ -62,52 +62,48 @@ def iii(a) -> Tuple[int, Optional[str]]:
     i_ = 0
     s_ = ""
     try:
-        dbi = get_item_from_db(item_id=a[z[1]][z[3]])
-        logger.debug(f"Item ID: {a[z[1]][z[3]]} not found in the database. Report this error on Discord: "
+        dbi = get_item_from_db(item_id=a[_ITEM][_ID])
+        logger.debug(f"Item ID: {a[_ITEM][_ID]} not found in the database. Report this error on Discord: "
                      f"{project_discord} - Thanks.")
     except KeyError:
         return i_, s_
     try:
-        i_ = dbi[z[0]]
+        i_ = dbi[_ITEM_LEVEL]
     except KeyError:
         return i_, s_
-    for m in a[z[1]].get(z[7], []):
-        if m[z[4]] == 9 and len(a[z[1]].get(z[6], [])) > 0:
-            plv = m[z[9]]
-            for bid in a[z[1]][z[6]]:
-                try:
-                    dbb = get_bonus_from_db(bonus_id=bid)
-                except KeyError:
-                    continue
-                if z[8] not in dbb:
+
+    # Both passes below need the same bonuses, only look them up once.
+    dbbs = []
+    for bid in a[_ITEM].get(_BONUS_LISTS, []):
+        try:
+            dbbs.append(get_bonus_from_db(bonus_id=bid))
+        except KeyError:
+            continue
+
+    for m in a[_ITEM].get(_MODIFIERS, []):
+        if m[_TYPE] == 9 and dbbs:
+            plv = m[_VALUE]
+            for dbb in dbbs:
+                if _CURVE_ID not in dbb:
                     continue
-                dbc = get_curve_from_db(curve_id=dbb[z[8]])
-                # noinspection PyBroadException
-                try:
-                    # noinspection PyArgumentList
-                    nl = int(round((interp1d([x[z[10]] for x in dbc[z[5]]],
-                                             [x[z[11]] for x in dbc[z[5]]])(plv)).min()))
-                except Exception:
-                    nl = dbc[z[5]][-1][z[11]]
+                xs, ys = get_curve_points_from_db(curve_id=dbb[_CURVE_ID])
+                # Levels outside the curve resolve to its final point (np.interp already clamps the upper end).
+                nl = int(round(float(np.interp(plv, xs, ys, left=ys[-1]))))
                 logger.debug(f"{i_}->{nl}.")
                 i_ = nl if nl > 0 else i_
 
     mtil = 0
-    for bbbb in a[z[1]].get(z[6], []):
-        try:
-            dbb = get_bonus_from_db(bonus_id=bbbb)
-        except KeyError:
-            continue
-        if z[2] in dbb:
-            mtil += dbb[z[2]]
-        if z[12] in dbb:
-            s_ = dbb[z[12]]
+    for dbb in dbbs:
+        if _LEVEL in dbb:
+            mtil += dbb[_LEVEL]
+        if _NAME in dbb:
+            s_ = dbb[_NAME]
 
     if mtil != 0:
         logger.debug(f"{i_}->{i_ + mtil}.")
         i_ += mtil
     else:
-        logger.debug(f"F {a[z[1]]['id']}=={i_}.")
+        logger.debug(f"F {a[_ITEM]['id']}=={i_}.")
 
     return i_, s_
 
@@ -142,6 +138,21 @@ def get_curve_from_db(*,
     return curves[str(curve_id)]
 
 
+@lru_cache
+def get_curve_points_from_db(*,
+                             curve_id: int
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    A cached method to get the player level (x) and item level (y) points of a curve, ready for interpolation.
+
+    :param curve_id: The curve id to lookup.
+    """
+
+    points = get_curve_from_db(curve_id=curve_id)[_POINTS]
+
+    return np.array([x[_PLAYER_LEVEL] for x in points]), np.array([x[_CURVE_ITEM_LEVEL] for x in points])
+
+
 @lru_cache
 def get_bonus_from_db(*,
                       bonus_id: int
@@ -4,21 +4,43 @@ Common function for loading all static data.
 Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL PUBLIC LICENSE.
 """
 
-import json
 import logging
 import os
-from datetime import datetime
+import pickle
+import tempfile
 from functools import lru_cache
-from typing import Dict
+from time import time
+from typing import Dict, Optional
 
+from ..__version__ import __version__
 from ..errors import GSAException
 
+try:
+    # orjson is optional, but parses the larger databases (eg. items.json) several times faster.
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 logger = logging.getLogger("GSA")
 
 z = ['item_level', 'item', 'level', 'id', 'type', 'points', 'bonus_lists',
      'modifiers', 'curveId', 'value', 'playerLevel', 'itemLevel', 'name']
 
 
+def user_cache_dir() -> str:
+    """
+    Where parsed databases are pickled, as unpickling is much faster than parsing. This is per user (and per GSA
+    version) rather than inside the install, which may not be writable and shouldn't be trusted to unpickle from.
+    """
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(base, "GoblinStockAlerts", __version__)
+
+
 @lru_cache
 def load_db(*,
             db: str
@@ -36,16 +58,94 @@ def load_db(*,
     if not os.path.isfile(db_path):
         raise GSAException(f"File {db_path} not found.")
 
-    # We must allow utf-8 as some realm names have UTF-8 characters,
-    # this could be useful if we ever do localizations.
-    with open(db_path, 'r', encoding='utf-8') as f:
-        data = json.loads(f.read())
-        logger.debug(f"Loaded {db_path}.")
+    mtime = os.stat(db_path).st_mtime_ns
+    cache_path = os.path.join(user_cache_dir(), f"{db}.pickle")
+
+    data = load_cached_db(cache_path=cache_path, mtime=mtime)
+    if data is None:
+        # Read as bytes, both parsers decode the UTF-8 themselves (some realm names have UTF-8 characters),
+        # this could be useful if we ever do localizations.
+        with open(db_path, 'rb') as f:
+            data = loads(f.read())
+            logger.debug(f"Loaded {db_path}.")
+
+        save_cached_db(cache_path=cache_path, mtime=mtime, data=data)
+
+    check_db_freshness(db=db, last_updated=data.get('last_updated', 0))
+
+    return data.get('data', [])
+
+
+def load_cached_db(*,
+                   cache_path: str,
+                   mtime: int
+                   ) -> Optional[Dict]:
+    """
+    Return a previously parsed database, or None if there isn't one for this version of the file.
+
+    :param cache_path: The pickled database file.
+    :param mtime: The modified time (ns) of the JSON database it should have been made from.
+    """
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_mtime, data = pickle.load(f)
+    except Exception:  # Missing, unreadable or from an incompatible version, just parse the JSON again.
+        return None
+
+    if cached_mtime != mtime:
+        return None
+
+    logger.debug(f"Loaded {cache_path}.")
+    return data
+
+
+def save_cached_db(*,
+                   cache_path: str,
+                   mtime: int,
+                   data: Dict
+                   ) -> None:
+    """
+    Pickle a parsed database for the next start. Failing to do so is not an error, it'll just be parsed again.
+
+    :param cache_path: The pickled database file.
+    :param mtime: The modified time (ns) of the JSON database it was made from.
+    :param data: The parsed database.
+    """
+
+    cache_dir = os.path.dirname(cache_path)
+    tmp_path = None
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written to a temporary file first and moved into place, so another GSA starting up never reads a half
+        # written pickle and a failed write never leaves one behind.
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+            tmp_path = f.name
+            pickle.dump((mtime, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as ex:
+        logger.debug(f"Unable to cache {cache_path}: {ex}.")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+@lru_cache
+def check_db_freshness(*,
+                       db: str,
+                       last_updated: int
+                       ) -> None:
+    """
+    Warn (once per database) if a database file is old enough that it is likely outdated.
+
+    :param db: The database file that was opened.
+    :param last_updated: The timestamp the database was last updated.
+    """
 
     # This is a soft requirement to push people to upgrade to reduce support queries.
     # 120 days feels very fair, which is three times per year.
-    last_updated = datetime.fromtimestamp(data.get('last_updated', 0))
-    if (datetime.utcnow() - last_updated).days > 365:
+    if time() - last_updated > 365 * 24 * 60 * 60:
         logger.info(f"GSA database '{db}' is over 365 days old. It is highly likely it will be outdated.")
-
-    return data.get('data', [])
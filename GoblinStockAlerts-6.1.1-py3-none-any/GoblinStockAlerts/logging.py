@@ -5,8 +5,7 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 """
 
 import logging.config
-
-import coloredlogs
+import sys
 
 from .__version__ import __version__
 
@@ -27,6 +26,19 @@ def setup_logger(*,
     else:
         message_format = f"%(asctime)s %(name)s-{__version__} %(message)s"
 
+    level = logging.DEBUG if debug else logging.INFO
+    gsa_logger = logging.getLogger("GSA")
+
+    # No point styling every record if the output is being redirected, a plain handler will do.
+    if not sys.stderr.isatty():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(message_format))
+        gsa_logger.addHandler(handler)
+        gsa_logger.setLevel(level)
+        return
+
+    import coloredlogs
+
     field_styles = {
         "asctime": {"color": "green"},
         "levelname": {"color": "magenta"},
@@ -41,6 +53,6 @@ def setup_logger(*,
         "critical": {"color": "red", "bold": True},
     }
 
-    coloredlogs.install(level=logging.DEBUG if debug else logging.INFO,
-                        logger=logging.getLogger("GSA"), fmt=message_format,
+    coloredlogs.install(level=level,
+                        logger=gsa_logger, fmt=message_format,
                         level_styles=level_styles, field_styles=field_styles)
@@ -5,9 +5,11 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 """
 
 import logging
+import sys
 from collections import defaultdict
 from functools import lru_cache
-from typing import Dict, Union, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 from ruamel.yaml.scalarfloat import ScalarFloat
 
@@ -18,6 +20,9 @@ logger = logging.getLogger("GSA")
 
 PET_CAGE_ID = 82800
 
+# Valid types for a pet or item budget, ruamel loads decimals as ScalarFloat.
+_BUDGET_TYPES = (int, float, ScalarFloat)
+
 
 def check_pet_validity(*,
                        pet: Dict
@@ -31,7 +36,7 @@ def check_pet_validity(*,
     if 'budget' not in pet:
         raise GSAConfigurationError(f"Missing a budget.")
 
-    if type(pet['budget']) not in (int, float, ScalarFloat):
+    if not isinstance(pet['budget'], _BUDGET_TYPES):
         raise GSAConfigurationError(f"Budget is not valid (int/float).")
 
     if 'species_id' not in pet:
@@ -55,87 +60,93 @@ def check_pet_validity(*,
 
 
 @lru_cache
-def load_pet_species_db(*,
-                        index_by_value: bool = False
-                        ) -> Union[dict, defaultdict]:
+def index_pet_db(*,
+                 db: str
+                 ) -> Tuple[Mapping[str, str], Mapping[str, List[int]]]:
     """
-    A cached method to return a dictionary containing all Battle Pets in World of Warcraft.
+    Load a pet database, returning it as is (id: name) and indexed by value (NAME: [ids]) in a single pass.
 
-    :param index_by_value: Set TRUE if dictionary key should be pet name rather than id.
+    :param db: The database file to be loaded.
     """
 
-    pets = load_db(db="pet_species.json")
+    # Names are interned, these are compared and looked up constantly for the life of the process.
+    data = {key: sys.intern(value) for key, value in load_db(db=db).items()}
 
-    if index_by_value:
-        named_pets = defaultdict(list)
-        for pet in pets:
-            named_pets[pets[pet].upper()].append(int(pet))
+    named = defaultdict(list)
+    for key, value in data.items():
+        named[sys.intern(value.upper())].append(int(key))
 
-        pets = named_pets
-
-    logger.debug(f"{len(pets)} pets loaded.")
-    return pets
+    logger.debug(f"{len(data)} entries loaded from {db}.")
+    return MappingProxyType(data), MappingProxyType(dict(named))
 
 
 @lru_cache
-def load_pet_quality_db(*,
+def index_pet_db_by_id(*,
+                       db: str
+                       ) -> Mapping[int, str]:
+    """
+    Load a pet database keyed by integer id, auctions give breed and quality ids as integers.
+
+    :param db: The database file to be loaded.
+    """
+
+    data, _ = index_pet_db(db=db)
+
+    return MappingProxyType({int(key): value for key, value in data.items()})
+
+
+def load_pet_species_db(*,
                         index_by_value: bool = False
-                        ) -> Union[dict, defaultdict]:
+                        ) -> Mapping:
     """
-    A cached method to return a dictionary containing all Battle Pet Qualities in World of Warcraft.
+    Return a dictionary containing all Battle Pets in World of Warcraft.
 
     :param index_by_value: Set TRUE if dictionary key should be pet name rather than id.
     """
 
-    qualities = load_db(db="pet_quality.json")
+    data, named = index_pet_db(db="pet_species.json")
 
-    if index_by_value:
-        named_qualities = defaultdict(list)
-        for quality in qualities:
-            named_qualities[qualities[quality].upper()].append(int(quality))
+    return named if index_by_value else data
 
-        qualities = named_qualities
 
-    logger.debug(f"{len(qualities)} pet qualities loaded.")
-    return qualities
+def load_pet_quality_db(*,
+                        index_by_value: bool = False
+                        ) -> Mapping:
+    """
+    Return a dictionary containing all Battle Pet Qualities in World of Warcraft.
+
+    :param index_by_value: Set TRUE if dictionary key should be pet name rather than id.
+    """
+
+    data, named = index_pet_db(db="pet_quality.json")
+
+    return named if index_by_value else data
 
 
-@lru_cache
 def load_pet_breed_db(*,
                       index_by_value: bool = False
-                      ) -> Union[dict, defaultdict]:
+                      ) -> Mapping:
     """
-    A cached method to return a dictionary containing all Battle Pet Breeds in World of Warcraft.
+    Return a dictionary containing all Battle Pet Breeds in World of Warcraft.
 
     :param index_by_value: Set TRUE if dictionary key should be pet breed rather than id.
     """
 
-    breeds = load_db(db="pet_breeds.json")
+    data, named = index_pet_db(db="pet_breeds.json")
 
-    if index_by_value:
-        named_breeds = defaultdict(list)
-        for breed in breeds:
-            named_breeds[breeds[breed].upper()].append(int(breed))
+    return named if index_by_value else data
 
-        breeds = named_breeds
 
-    logger.debug(f"{len(breeds)} pet breeds loaded.")
-    return breeds
-
-
-@lru_cache
 def get_pet_breed_from_db(*,
                           pet_breed_id: int
                           ) -> str:
     """
-    A cached method to check what the breed of a pet breed_id is.
+    Check what the breed of a pet breed_id is.
 
     :param pet_breed_id: The breed id to lookup.
     """
 
-    breeds = load_pet_breed_db()
-
-    return breeds[str(pet_breed_id)]
+    return index_pet_db_by_id(db="pet_breeds.json")[pet_breed_id]
 
 
 @lru_cache
@@ -149,7 +160,7 @@ def get_pet_breed_id_from_db(*,
     """
 
     breeds = load_pet_breed_db(index_by_value=True)
-    breeds = breeds[pet_breed.upper()]
+    breeds = breeds.get(pet_breed.upper(), [])
 
     if len(breeds) == 0:
         raise GSAConfigurationError(f"A pet quality of {pet_breed} was not found.")
@@ -157,19 +168,16 @@ def get_pet_breed_id_from_db(*,
     return breeds
 
 
-@lru_cache
 def get_pet_quality_from_db(*,
                             pet_quality_id: int
                             ) -> str:
     """
-    A cached method to check what the quality of a pet quality_id is.
+    Check what the quality of a pet quality_id is.
 
     :param pet_quality_id: The quality id to lookup.
     """
 
-    qualities = load_pet_quality_db()
-
-    return qualities[str(pet_quality_id)]
+    return index_pet_db_by_id(db="pet_quality.json")[pet_quality_id]
 
 
 @lru_cache
@@ -183,7 +191,7 @@ def get_pet_quality_id_from_db(*,
     """
 
     qualities = load_pet_quality_db(index_by_value=True)
-    qualities = qualities[pet_quality.upper()]
+    qualities = qualities.get(pet_quality.upper(), [])
 
     if len(qualities) == 0:
         raise GSAConfigurationError(f"A pet quality of {pet_quality} was not found.")
@@ -5,8 +5,10 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 """
 
 import logging
+import sys
 from functools import lru_cache
-from typing import List
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 from .errors import GSAConfigurationError
 from .helpers import convert_slug_to_string
@@ -16,24 +18,62 @@ logger = logging.getLogger("GSA")
 
 
 @lru_cache
+def index_connected_realms_db() -> Mapping[str, Mapping[str, List[str]]]:
+    """
+    Load the connected realms database for every region, each connected realm group sorted alphabetically.
+    """
+
+    regions = {}
+    for region, connected_realms in load_db(db="connected_realms.json").items():
+        # For consistency lets order each group alphabetically, interning the slugs as they're used as lookup keys.
+        regions[region] = MappingProxyType({connected_realm_group_id: sorted(map(sys.intern, connected_realm_group))
+                                            for connected_realm_group_id, connected_realm_group
+                                            in connected_realms.items()})
+
+        logger.debug(f"{len(connected_realms)} {region} connected realm groups loaded.")
+
+    return MappingProxyType(regions)
+
+
+@lru_cache
+def index_realm_connected_ids() -> Mapping[str, Mapping[str, int]]:
+    """
+    Reverse index of every realm (slug) to its connected realm id, per region.
+    """
+
+    return MappingProxyType({
+        region: MappingProxyType({realm: int(connected_realm_id)
+                                  for connected_realm_id, connected_realm_group in connected_realms.items()
+                                  for realm in connected_realm_group})
+        for region, connected_realms in index_connected_realms_db().items()
+    })
+
+
+@lru_cache
+def index_pretty_realms() -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
+    """
+    The pretty (non-slug) names of every connected realm group, per region.
+    """
+
+    return MappingProxyType({
+        region: MappingProxyType({connected_realm_id: tuple(convert_slug_to_string(slug=realm)
+                                                            for realm in connected_realm_group)
+                                  for connected_realm_id, connected_realm_group in connected_realms.items()})
+        for region, connected_realms in index_connected_realms_db().items()
+    })
+
+
 def load_connected_realms_db(*,
                              region: str
-                             ) -> dict:
+                             ) -> Mapping[str, List[str]]:
     """
-    A cached method to return a dictionary containing realm metadata for the region specified.
+    Return a dictionary containing realm metadata for the region specified.
 
     :param region: Which region realms should be returned for
     :return: A dictionary containing realms and their associated metadata
     """
-    connected_realms = load_db(db="connected_realms.json")[region.upper()]
 
-    # For consistency lets order each group alphabetically
-    for connected_realm_group_id in connected_realms:
-        connected_realms[connected_realm_group_id] = sorted(connected_realms[connected_realm_group_id])
-
-    logger.debug(f"{len(connected_realms)} connected realm groups loaded.")
-
-    return connected_realms
+    return index_connected_realms_db()[region.upper()]
 
 
 @lru_cache
@@ -49,7 +89,6 @@ def get_connected_realm_ids(*,
     return [int(connected_realm_id) for connected_realm_id in load_connected_realms_db(region=region.upper())]
 
 
-@lru_cache
 def get_realm_connected_id(*,
                            realm_name: str,
                            region: str
@@ -61,34 +100,21 @@ def get_realm_connected_id(*,
     :param region: The region being queried (eg. US, EU).
     """
 
-    connected_realms = load_connected_realms_db(region=region)
-
-    for connected_realm_group in connected_realms:
-
-        if realm_name in connected_realms[connected_realm_group]:
-            connected_realm_id = connected_realm_group
-            break
-
-    else:
+    try:
+        return index_realm_connected_ids()[region.upper()][realm_name]
+    except KeyError:
         raise GSAConfigurationError(f"Realm {realm_name} was not found in the region: {region}.")
 
-    return int(connected_realm_id)
-
 
-@lru_cache
 def get_pretty_list_of_realms_on_connected_id(*,
                                               connected_realm_id=int,
                                               region: str
-                                              ) -> List[str]:
+                                              ) -> Tuple[str, ...]:
     """
-    Returns a non-slug list of strings for the realms connected the specified id.
+    Returns the non-slug names of the realms connected the specified id.
 
     :param connected_realm_id: The connected realm id being requested.
     :param region: The region being queried (eg. US, EU).
     """
 
-    connected_realms = load_connected_realms_db(region=region)
-
-    group = connected_realms[str(connected_realm_id)]
-
-    return [convert_slug_to_string(slug=realm) for realm in group]
+    return index_pretty_realms()[region.upper()][str(connected_realm_id)]
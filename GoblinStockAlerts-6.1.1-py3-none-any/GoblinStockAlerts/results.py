@@ -8,8 +8,10 @@ TODO: THIS FILE IS PARTICULARLY "SPAGHETTI" AND NEEDS WORK.
 
 import logging
 import sys
-from datetime import datetime, timedelta
-from time import sleep
+from datetime import datetime, timezone
+from queue import Empty, Queue
+from threading import Thread
+from time import time
 from traceback import format_exc
 from typing import Callable, Optional
 
@@ -20,6 +22,12 @@ from .state import STATE_NEW_DATA, STATE_SCHEDULED, STATE_READY, STATE_FINISHED,
 
 logger = logging.getLogger("GSA")
 
+# Windows notifications are shown from their own thread so the result watcher never waits on the Shell API.
+_notifications = Queue()
+_notifier = None
+# Cleared if winotify can't be imported, so nothing more is queued for a thread that has stopped.
+_notifications_enabled = True
+
 
 def result_watcher(*,
                    rs: RealmState,
@@ -40,99 +48,117 @@ def result_watcher(*,
     :param addon_path: (OPTIONAL) The path to the user's World of Warcraft addon folder.
     """
 
-    timer = datetime.utcnow()
+    # The connected realms being tracked never change once scheduling has started.
+    realms = tuple(rs.states)
+    n_realms = len(realms)
+
+    timer = time()
     updated = 0
     while True:
         try:
-            for connected_realm in rs.states:
-
-                if rs.states[connected_realm].status == STATE_SCHEDULED:
-
-                    if rs.states[connected_realm].response and rs.states[connected_realm].response.done():
-                        rs.states[connected_realm].status = STATE_FINISHED
-
-                        # noinspection PyBroadException
-                        try:
-                            status, error, auctions, desync, last_modified, data_hash = \
-                                rs.states[connected_realm].response.result()
-
-                        except Exception:
-                            # Extreme mode has caused some weird things here...
-                            logger.critical("ResultWatcher: There was a critical error. Please restart GSA.")
-                            return
-
-                        if STATE_NEW_DATA and data_hash in rs.states[connected_realm].hashes:
-                            logger.error(f"{connected_realm} returned old data! SHA256 '{data_hash}' has"
-                                         f" been seen before despite having a last modified being shown by Blizzard "
-                                         f"as {last_modified} (UTC)'. This realm has been queued again.")
-                            rs.states[connected_realm].status = STATE_READY
-
-                        # Did it update?
-                        elif status == STATE_NEW_DATA:
-                            logger.debug(f"{connected_realm} had new data.")
-
-                            if updated == 0:
-                                if addon_path:
-                                    reset_addon_deals(addon_directory=addon_path)
-                                timer = datetime.utcnow()
-                                display_speed_message(connected_realm_id=connected_realm, region=region)
-
-                            try:
-                                deal_callback(connected_realm_id=connected_realm,
-                                              item_deals=auctions['items'],
-                                              pet_deals=auctions['pets'],
-                                              addon_path=addon_path)
-
-                            except Exception as ex:
-                                logger.debug(f"{format_exc()}.")
-                                logger.error(f"Deals callback encountered an exception: {ex}.")
-
-                            updated += 1
-
-                            if updated == len(rs.states):
-                                display_speed_message(connected_realm_id=connected_realm, region=region, slowest=True)
-
-                            # Only update last_modified if we actually found new data.
-                            rs.states[connected_realm].hashes.append(data_hash)
-                            rs.states[connected_realm].last_modified = last_modified
-                            rs.states[connected_realm].status = STATE_NEW_DATA
-                            if desync is not None:
-                                logger.debug(f"{connected_realm} was served by a node with a desync of {desync}s")
-                                rs.desync = desync
-
-                        elif status == STATE_ERROR:
-                            if len(error) > 0:
-                                logger.error(f"Issue with realm {connected_realm} : {error} - "
-                                             f"It will be rescanned momentarily.")
-                            rs.states[connected_realm].status = STATE_READY
-
-                        elif status == STATE_ERROR_QUOTA:
-                            logger.debug(f"Blizzard returned a quota error on querying realm: {connected_realm}.")
-                            rs.states[connected_realm].status = STATE_ERROR_QUOTA
-
-                        else:
-                            rs.states[connected_realm].status = STATE_READY
-
-                        rs.states[connected_realm].last_checked = datetime.utcnow()
-                        rs.states[connected_realm].response = None
-
-            if updated == len(rs.states):
+            # Workers report their realm as soon as they finish, so wait on that rather than polling every realm.
+            try:
+                connected_realm = rs.finished.get(timeout=1)
+            except Empty:
+                connected_realm = None
+
+            # One clock read per pass, shared by everything below.
+            now = time()
+
+            if connected_realm is not None and rs.statuses[connected_realm] == STATE_SCHEDULED:
+                st = rs.states[connected_realm]
+                rs.set_status(connected_realm, STATE_FINISHED)
+
+                # noinspection PyBroadException
+                try:
+                    status, error, auctions, desync, last_modified, data_hash = rs.responses[connected_realm].result()
+
+                except Exception:
+                    # Extreme mode has caused some weird things here...
+                    logger.critical("ResultWatcher: There was a critical error. Please restart GSA.")
+                    return
+
+                if status == STATE_NEW_DATA and data_hash in st.hashes:
+                    logger.error(f"{connected_realm} returned old data! SHA256 '{data_hash}' has"
+                                 f" been seen before despite having a last modified being shown by Blizzard "
+                                 f"as {last_modified} (UTC)'. This realm has been queued again.")
+                    rs.set_status(connected_realm, STATE_READY)
+
+                # Did it update?
+                elif status == STATE_NEW_DATA:
+                    logger.debug("%s had new data.", connected_realm)
+
+                    if updated == 0:
+                        if addon_path:
+                            reset_addon_deals(addon_directory=addon_path)
+                        timer = now
+                        display_speed_message(connected_realm_id=connected_realm, region=region)
+
+                    try:
+                        deal_callback(connected_realm_id=connected_realm,
+                                      item_deals=auctions['items'],
+                                      pet_deals=auctions['pets'],
+                                      addon_path=addon_path)
+
+                    except Exception as ex:
+                        logger.debug("%s.", format_exc())
+                        logger.error(f"Deals callback encountered an exception: {ex}.")
+
+                    updated += 1
+
+                    if updated == n_realms:
+                        display_speed_message(connected_realm_id=connected_realm, region=region, slowest=True)
+
+                    if desync is not None:
+                        logger.debug("%s was served by a node with a desync of %ss", connected_realm, desync)
+                        rs.desync = desync
+
+                    # Only update last_modified if we actually found new data. The realm is due again just under an
+                    # hour later in server time, worked out here once rather than on every scheduler tick.
+                    st.add_hash(data_hash)
+                    st.last_modified = last_modified
+                    st.next_ready_at = (last_modified.replace(tzinfo=timezone.utc).timestamp()
+                                        + (60 * 60) - 9 - rs.desync)
+                    rs.set_status(connected_realm, STATE_NEW_DATA)
+
+                elif status == STATE_ERROR:
+                    if len(error) > 0:
+                        logger.error(f"Issue with realm {connected_realm} : {error} - "
+                                     f"It will be rescanned momentarily.")
+                    rs.set_status(connected_realm, STATE_READY)
+
+                elif status == STATE_ERROR_QUOTA:
+                    logger.debug("Blizzard returned a quota error on querying realm: %s.", connected_realm)
+                    rs.set_status(connected_realm, STATE_ERROR_QUOTA)
+
+                elif status == STATE_SCHEDULED:
+                    rs.set_status(connected_realm, STATE_READY)
+
+                else:
+                    # Workers only ever report one of the above, anything else is a bug in download.py.
+                    logger.error(f"Realm {connected_realm} reported an unexpected status ({status}), "
+                                 f"it has been queued again.")
+                    rs.set_status(connected_realm, STATE_READY)
+
+                st.last_checked = now
+                rs.max_last_checked = now
+                rs.responses[connected_realm] = None
+
+            if updated == n_realms:
                 updated = 0
-                timer = datetime.utcnow()
+                timer = now
 
-                for connected_realm in rs.states:
-                    rs.states[connected_realm].status = STATE_READY
+                for connected_realm in realms:
+                    rs.set_status(connected_realm, STATE_READY)
 
-            if updated > 0 and (datetime.utcnow() - timer).total_seconds() >= 30:
-                logger.info(f"Progress: {updated}/{len(rs.states)}")
-                timer = datetime.utcnow()
+            if updated > 0 and now - timer >= 30:
+                logger.info(f"Progress: {updated}/{n_realms}")
+                timer = now
 
-            if updated == 0 and (datetime.utcnow() - timer).total_seconds() >= 300:
-                server_time = (datetime.utcnow() + timedelta(seconds=rs.desync)).strftime("%H:%M:%S")
+            if updated == 0 and now - timer >= 300:
+                server_time = datetime.utcfromtimestamp(now + rs.desync).strftime("%H:%M:%S")
                 logger.info(f"Waiting until next snapshot, Blizzard servers (UTC) currently: {server_time})...")
-                timer = datetime.utcnow()
-
-            sleep(0.01)
+                timer = now
 
         except Exception as ex:
             logger.critical(f"{ex} {format_exc()}")
@@ -157,13 +183,55 @@ def display_speed_message(*,
         message = f"New Blizzard Auction House data! Found on: {connected_realm_id} ({', '.join(pretty)})."
 
         if sys.platform.startswith("win"):
-            from winotify import Notification
-            t = Notification(app_id="GoblinStockAlerts",
-                             title="New Blizzard Auction House data!",
-                             msg=f"{', '.join(pretty)}")
-            t.build().show()
+            send_notification(title="New Blizzard Auction House data!", message=', '.join(pretty))
 
     else:
         message = f"All realms scanned. Last realm: {connected_realm_id} ({', '.join(pretty)})."
 
     logger.info(message)
+
+
+def send_notification(*,
+                      title: str,
+                      message: str
+                      ) -> None:
+    """
+    Queue a Windows notification, starting the thread that shows them if needed.
+
+    :param title: The title of the notification.
+    :param message: The body of the notification.
+    """
+
+    global _notifier
+
+    if not _notifications_enabled:
+        return
+
+    if _notifier is None:
+        _notifier = Thread(target=notification_worker, name="GSA-Notifications", daemon=True)
+        _notifier.start()
+
+    _notifications.put_nowait((title, message))
+
+
+def notification_worker() -> None:
+    """
+    Show queued Windows notifications, one at a time, forever.
+    """
+
+    global _notifications_enabled
+
+    try:
+        from winotify import Notification
+    except ImportError as ex:
+        logger.error(f"Unable to show Windows notifications, they have been turned off: {ex}.")
+        _notifications_enabled = False
+        return
+
+    while True:
+        title, message = _notifications.get()
+
+        try:
+            Notification(app_id="GoblinStockAlerts", title=title, msg=message).build().show()
+        except Exception as ex:
+            logger.debug("Unable to show a notification: %s.", ex)
@@ -9,7 +9,6 @@ import logging
 import random
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from datetime import datetime, timedelta
 from typing import Callable, Optional, Union
 
 from GameAPI.blizzard import BlizzardAPI
@@ -52,29 +51,37 @@ def schedule(*,
     worker_pool = None
 
     while True:
-        realms = list(GSA.shopping)
-        random.shuffle(realms)
-
-        for realm in realms:
-
-            if should_connected_realm_be_queued(state=rs, connected_realm=realm):
-                if worker_pool is None:
-                    worker_pool = setup_workers(api=api, rs=rs)
-
-                try:
-                    rs.states[realm].response = worker_pool.submit(download_auction_house_and_find_deals,
-                                                                   shopping=GSA.shopping,
-                                                                   api=api,
-                                                                   connected_realm_id=realm,
-                                                                   modified_timestamp=rs.states[realm].last_modified)
-                except Exception as ex:
-                    logger.error(f"{ex}")
-                    logger.critical("Scheduler: There was a critical error. Please restart GSA.")
-                    watcher_threads.shutdown(wait=True, cancel_futures=True)
-                    return
-
-                else:  # No exception
-                    rs.states[realm].status = STATE_SCHEDULED
+        # STATE_ERROR_QUOTA: A query excepted because Blizzard returned a 429 - we'll stop all scheduling.
+        if rs.quota:
+            apply_quota_brakes(state=rs)
+
+        # Only realms that are ready and due come off the heap, so nothing else is looked at. They're shuffled so no
+        # realm is always queried first.
+        due = rs.pop_due(time.time())
+        random.shuffle(due)
+
+        if due:
+            if worker_pool is None:
+                worker_pool = setup_workers(api=api, rs=rs)
+
+            try:
+                for realm in due:
+                    response = worker_pool.submit(download_auction_house_and_find_deals,
+                                                  shopping=GSA.shopping,
+                                                  api=api,
+                                                  connected_realm_id=realm,
+                                                  modified_timestamp=rs.states[realm].last_modified)
+                    rs.responses[realm] = response
+                    rs.set_status(realm, STATE_SCHEDULED)
+
+                    # Wake the result watcher once this realm is done. Added after the status change, as a future
+                    # that is already done calls back immediately.
+                    response.add_done_callback(lambda _, r=realm: rs.finished.put(r))
+            except Exception as ex:
+                logger.error(f"{ex}")
+                logger.critical("Scheduler: There was a critical error. Please restart GSA.")
+                watcher_threads.shutdown(wait=True, cancel_futures=True)
+                return
 
         if GSA.settings['workers_shutdown']:
             if worker_pool is not None and should_executor_be_shutdown(realm_states=rs):
@@ -100,7 +107,7 @@ def setup_workers(*,
     logger.info("Workers starting up...")
     if GSA.settings['workers_use_multiprocessing']:
         worker_pool = ProcessPoolExecutor(max_workers=GSA.settings['workers'])
-        logger.warning(extreme_warning)
+        logger.warning(extreme_warning())
     else:
         worker_pool = ThreadPoolExecutor(max_workers=GSA.settings['workers'])
 
@@ -122,62 +129,48 @@ def test_api(*,
     :param rs: The state dictionary for all connected realms.
     """
 
-    try:
-        for _ in range(3):
+    # One successful call is enough, the result watcher keeps the desync up to date from then on.
+    for attempt in range(3):
+        try:
             result = api.wow.token()
-            desync = result.get('GameAPI_Local_Server_Desync', 0)
-            logger.debug(f"Token served by node with a desync of {desync}")
-            rs.desync = desync
-        logger.info(f"API has been checked and is working. (Local PC/Blizzard CDN average desync is {rs.desync}s)")
-    except Exception as ex:
-        logger.error(f"It's time to task the workers, but the API is failing? {ex}. If this is the first run of GSA"
-                     f" please check your Client ID/Secret.")
-        return False
+        except Exception as ex:
+            if attempt < 2:
+                continue
+
+            logger.error(f"It's time to task the workers, but the API is failing? {ex}. If this is the first run of "
+                         f"GSA please check your Client ID/Secret.")
+            return False
 
+        desync = result.get('GameAPI_Local_Server_Desync', 0)
+        logger.debug("Token served by node with a desync of %s", desync)
+        rs.desync = desync
+        break
+
+    logger.info(f"API has been checked and is working. (Local PC/Blizzard CDN average desync is {rs.desync}s)")
     return True
 
 
-def should_connected_realm_be_queued(*,
-                                     state: RealmState,
-                                     connected_realm: int
-                                     ) -> bool:
+def apply_quota_brakes(*,
+                       state: RealmState
+                       ) -> None:
     """
-    Decides whether or not a connected realm is ready to be queried.
+    Stop all scheduling until fifteen seconds after the last realm that hit the quota, then let them be queued again.
 
     :param state: The state dictionary.
-    :param connected_realm: The ID of the read being checked.
     """
 
-    realm_state = state.states[connected_realm]
-
-    # STATE_ERROR_QUOTA: The last query excepted because Blizzard returned a 429 - we'll stop all scheduling.
-    if realm_state.status == STATE_ERROR_QUOTA:
-        # Slam on the brakes. Stop all realms being queried for twenty seconds.
-        logger.critical(quota_warning)
-        while (datetime.utcnow() - realm_state.last_checked).total_seconds() < 15:
-            time.sleep(0.5)
-
-        # Lets go and clear up the other ERROR_QUOTAS
-        for cr in state.states:
-            if state.states[cr].status == STATE_ERROR_QUOTA:
-                state.states[cr].status = STATE_READY
-        logger.info("Scheduling continuing...")
-
-    # We will not schedule a realm if it's in any of the following states.
-    # STATE_ERROR: The query function excepted for x reason.
-    # STATE_FINISHED: The query function has been detected as finished by the results scanner.
-    # STATE_NEW_DATA: The query function returned successfully and there was new data.
-    # STATE_SCHEDULED: The scheduler has tasked this realm to be queried.
-    if realm_state.status != STATE_READY:
-        return False
+    quota = list(state.quota)
 
-    # We will only query a realm if it's due in the next eight seconds
-    server_time = datetime.utcnow() + timedelta(seconds=state.desync)
-    if (server_time - realm_state.last_modified).total_seconds() < (60 * 60) - 9:
-        return False
+    # Slam on the brakes. Stop all realms being queried for fifteen seconds.
+    logger.critical(quota_warning())
+    while min(state.states[cr].age(time.time()) for cr in quota) < 15:
+        time.sleep(0.5)
 
-    # STATE_READY
-    return True
+    # Lets go and clear up the ERROR_QUOTAS
+    for cr in quota:
+        if state.statuses[cr] == STATE_ERROR_QUOTA:
+            state.set_status(cr, STATE_READY)
+    logger.info("Scheduling continuing...")
 
 
 def should_executor_be_shutdown(*,
@@ -188,13 +181,9 @@ def should_executor_be_shutdown(*,
 
     :param realm_states: The state dictionary with all realm metadata
     """
-    for cr in realm_states.states:
-        # If any realm isn't idling, don't shut down the workers.
-        if realm_states.states[cr].status != STATE_READY:
-            return False
-
-        # If any realm is freshly updated, keep workers online - safety net.
-        if (datetime.utcnow() - realm_states.states[cr].last_checked).total_seconds() < 90:
-            return False
+    # If any realm isn't idling, don't shut down the workers.
+    if realm_states.busy:
+        return False
 
-    return True
+    # If any realm is freshly updated, keep workers online - safety net.
+    return time.time() - realm_states.max_last_checked >= 90
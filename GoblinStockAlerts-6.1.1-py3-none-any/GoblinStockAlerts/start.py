@@ -6,9 +6,7 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 
 import logging
 from argparse import ArgumentParser, Namespace
-from typing import Optional, Callable
-
-from GameAPI.blizzard import BlizzardAPI
+from typing import Optional, Callable, TYPE_CHECKING
 
 from . import logo, GSA
 from .addon import install_addon
@@ -17,7 +15,9 @@ from .configuration import load_yaml_configuration_file, validate_configuration,
 from .errors import GSAException, GSAConfigurationError
 from .helpers import mask_string
 from .logging import setup_logger
-from .scheduler import schedule
+
+if TYPE_CHECKING:
+    from GameAPI.blizzard import BlizzardAPI
 
 logger = logging.getLogger("GSA")
 
@@ -33,6 +33,9 @@ def start(*,
     :param deal_callback: (OPTIONAL) A function pointer to the function to be called when deals are identified.
     """
 
+    # The scheduler (and with it the API client and worker pools) is only needed once GSA actually starts.
+    from .scheduler import schedule
+
     setup_logger(debug=args.debug)
 
     logger.info("GSA is starting.")
@@ -68,7 +71,7 @@ def start(*,
 def setup_api(*,
               region: str,
               client_id: Optional[str] = None,
-              client_secret: Optional[str] = None) -> BlizzardAPI:
+              client_secret: Optional[str] = None) -> "BlizzardAPI":
     """
     Initialize a BlizzardAPI object and verify it works by requesting the regions WoW Token value.
 
@@ -77,12 +80,16 @@ def setup_api(*,
     :param client_secret: The user's client_secret as provided by Blizzard.
     """
 
+    from GameAPI.blizzard import BlizzardAPI
+
     if not all((client_id, client_secret)):
         raise GSAConfigurationError("One or more of BNET_ID, BNET_SECRET environment variables were not found.")
 
-    logger.info(f"Setting up BlizzardAPI for the {region} region.")
-    logger.info(f"Client ID: {mask_string(input_string=client_id)}.")
-    logger.info(f"Client Secret: {mask_string(input_string=client_secret)}.")
+    # Don't bother masking credentials if nothing is going to be shown.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Setting up BlizzardAPI for the {region} region.")
+        logger.info(f"Client ID: {mask_string(input_string=client_id)}.")
+        logger.info(f"Client Secret: {mask_string(input_string=client_secret)}.")
 
     api = BlizzardAPI(client_id=client_id, client_secret=client_secret, region=region.upper())
 
@@ -90,7 +97,7 @@ def setup_api(*,
 
 
 if __name__ == "__main__":
-    print(logo)
+    print(logo())
 
     parser = ArgumentParser()
     parser.add_argument("-c", "--config",
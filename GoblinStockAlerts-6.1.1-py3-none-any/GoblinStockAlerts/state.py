@@ -6,46 +6,196 @@ Source Code Copyright (C) 2021 BinaryHabitat. Released under GNU LESSER GENERAL
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Dict
+from array import array
+from collections import deque
+from datetime import datetime
+from enum import IntEnum
+from heapq import heapify, heappop, heappush
+from queue import Queue
+from threading import Lock
+from time import time
+from types import MappingProxyType
+from typing import Dict, List, Optional
 
-STATE_ERROR_QUOTA = -2
-STATE_ERROR = -1
-STATE_READY = 0
-STATE_SCHEDULED = 1
-STATE_FINISHED = 2
-STATE_NEW_DATA = 3
+
+class Status(IntEnum):
+    """
+    The status of a connected realm, the STATE_* names below are kept for existing imports.
+    """
+
+    ERROR_QUOTA = -2
+    ERROR = -1
+    READY = 0
+    SCHEDULED = 1
+    FINISHED = 2
+    NEW_DATA = 3
+
+
+STATE_ERROR_QUOTA = Status.ERROR_QUOTA
+STATE_ERROR = Status.ERROR
+STATE_READY = Status.READY
+STATE_SCHEDULED = Status.SCHEDULED
+STATE_FINISHED = Status.FINISHED
+STATE_NEW_DATA = Status.NEW_DATA
 
 logger = logging.getLogger("GSA")
 
+# Seconds, realms start off as last checked this long ago so they're all due straight away.
+_ONE_DAY = 24 * 60 * 60
+
+
+class HashHistory:
+    """
+    The most recent data hashes seen for a connected realm. Bounded, so memory doesn't grow over days of running, and
+    backed by a set so checking a hash is constant time.
+    """
+
+    __slots__ = ("_order", "_seen")
+
+    # A realm gets new data roughly hourly, so the default covers the last few days of snapshots.
+    def __init__(self, maxlen: int = 64):
+        self._order = deque(maxlen=maxlen)
+        self._seen = set()
+
+    def __contains__(self, data_hash: str) -> bool:
+        return data_hash in self._seen
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def append(self, data_hash: str) -> None:
+        if data_hash in self._seen:
+            return
+
+        # The deque drops the oldest hash itself when full, so forget it here too.
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+
+        self._order.append(data_hash)
+        self._seen.add(data_hash)
+
 
 class State:
-    def __init__(self, connected_realm_id: int):
+    # One per connected realm, fixed attributes only.
+    __slots__ = ("id", "last_modified", "last_checked", "next_ready_at", "hashes")
+
+    # Shared by every realm until it sees its first data hash, plenty of realms never do.
+    _NO_HASHES = ()
+
+    def __init__(self, connected_realm_id: int, default_time: Optional[float] = None):
+        if default_time is None:
+            default_time = time() - _ONE_DAY
+
         self.id = connected_realm_id
-        self.status = STATE_READY
-        self.last_modified = datetime.utcnow() - timedelta(days=1)
-        self.last_checked = datetime.utcnow() - timedelta(days=1)
-        self.response = None
-        self.hashes = []
+        # Blizzard's last modified time (UTC) is sent back to them as is, so it stays a datetime.
+        self.last_modified = datetime.utcfromtimestamp(default_time)
+        # The rest are epoch timestamps, they're only ever compared.
+        self.last_checked = default_time
+        # When the realm is next due to be queried, updated along with last_modified.
+        self.next_ready_at = default_time
+        self.hashes = State._NO_HASHES
+
+    def age(self, now: float) -> float:
+        """
+        Seconds since the realm was last checked, now is passed in so callers can share a single clock read.
+
+        :param now: The current time (epoch).
+        """
+
+        return now - self.last_checked
+
+    def add_hash(self, data_hash: str) -> None:
+        if self.hashes is State._NO_HASHES:
+            self.hashes = HashHistory()
+
+        self.hashes.append(data_hash)
 
 
 class RealmState:
     def __init__(self, connected_realm_ids: Dict):
-        self._desync = []
-        self.states = {}
-        for connected_realm_id in connected_realm_ids:
-            self.states[connected_realm_id] = State(connected_realm_id)
+        # The last 100 desync samples in a ring buffer, with their sum and average, so adding a sample doesn't
+        # allocate and reading the average is just an attribute load.
+        self._desync = array('d', [0.0] * 100)
+        self._desync_index = 0
+        self._desync_count = 0
+        self._desync_sum = 0.0
+        self._desync_avg = 0.0
+        # Connected realms whose scheduled query has finished, waiting for the result watcher.
+        self.finished = Queue()
+        # Every realm starts off as last seen a day ago, so they're all due straight away.
+        yesterday = time() - _ONE_DAY
+        # The realms being tracked are fixed once created, only their State objects change.
+        self.states = MappingProxyType({connected_realm_id: State(connected_realm_id, default_time=yesterday)
+                                        for connected_realm_id in connected_realm_ids})
+
+        # The status and pending query (future) of each connected realm are kept apart from the rest of the state,
+        # they're what the scheduler and result watcher check most.
+        self.statuses = dict.fromkeys(self.states, STATE_READY)
+        self.responses = dict.fromkeys(self.states)
+
+        # Ready connected realms as a heap of (next_ready_at, id), so the scheduler only looks at realms that are due.
+        # Each realm is pushed when it becomes ready (by set_status) and popped by pop_due, from different threads.
+        self._due = [(state.next_ready_at, connected_realm_id) for connected_realm_id, state in self.states.items()]
+        heapify(self._due)
+        self._due_lock = Lock()
+        # Connected realms that hit the quota, so the scheduler can apply the brakes. Kept up to date by set_status.
+        self.quota = set()
+        # Connected realms that are not idling (anything other than STATE_READY), also kept up to date by set_status.
+        self.busy = set()
+        # The most recent last_checked of any connected realm, kept up to date by the result watcher.
+        self.max_last_checked = yesterday
+
+    def set_status(self, connected_realm_id: int, status: Status, *,
+                   _ready=STATE_READY, _quota=STATE_ERROR_QUOTA) -> None:
+        # Called on every status change by both the scheduler and the result watcher, so the constants it needs are
+        # bound as (keyword only, private) defaults to make them local lookups.
+        previous = self.statuses[connected_realm_id]
+        self.statuses[connected_realm_id] = status
+
+        if status == _ready:
+            self.busy.discard(connected_realm_id)
+
+            # Only queue the realm once per time it becomes ready, next_ready_at doesn't change while it is.
+            if previous != _ready:
+                with self._due_lock:
+                    heappush(self._due, (self.states[connected_realm_id].next_ready_at, connected_realm_id))
+        else:
+            self.busy.add(connected_realm_id)
+
+        if status == _quota:
+            self.quota.add(connected_realm_id)
+        else:
+            self.quota.discard(connected_realm_id)
+
+    def pop_due(self, now: float) -> List[int]:
+        """
+        Take every ready connected realm that is due to be queried.
+
+        :param now: The current time (epoch).
+        """
+
+        due = []
+        with self._due_lock:
+            while self._due and self._due[0][0] <= now:
+                _, connected_realm_id = heappop(self._due)
+
+                if self.statuses[connected_realm_id] == STATE_READY:
+                    due.append(connected_realm_id)
+
+        return due
 
     @property
     def desync(self):
-        try:
-            desync = sum(self._desync) / len(self._desync)
-        except ZeroDivisionError:
-            desync = 0
-
-        return desync
+        return self._desync_avg
 
     @desync.setter
     def desync(self, value):
-        # Only store the last 100 values.
-        self._desync = self._desync[:99] + [value]
+        # Only store the last 100 values, overwriting the oldest (which is 0.0 until the buffer has filled).
+        self._desync_sum += value - self._desync[self._desync_index]
+        self._desync[self._desync_index] = value
+        self._desync_index = (self._desync_index + 1) % len(self._desync)
+
+        if self._desync_count < len(self._desync):
+            self._desync_count += 1
+
+        self._desync_avg = self._desync_sum / self._desync_count